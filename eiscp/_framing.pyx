@@ -0,0 +1,28 @@
+# cython: language_level=3
+"""Optional C accelerator for eISCP packet framing.
+
+Compiled only when Cython is available at build time; ``core`` falls
+back to the pure-Python framing code when this module cannot be
+imported.
+"""
+
+from libc.string cimport memcmp
+
+
+def parse_packet(const unsigned char[:] buf, Py_ssize_t end):
+    """Return ``(payload, consumed)`` for the first complete eISCP
+    packet in ``buf[:end]``, or ``(None, 0)`` when more data is
+    needed.
+    """
+    cdef Py_ssize_t header_size, data_size
+    if end < 16:
+        return None, 0
+    if memcmp(&buf[0], b"ISCP", 4) != 0:
+        raise ValueError('bad eISCP header')
+    header_size = (buf[4] << 24) | (buf[5] << 16) | (buf[6] << 8) | buf[7]
+    if header_size != 16:
+        raise ValueError('bad eISCP header')
+    data_size = (buf[8] << 24) | (buf[9] << 16) | (buf[10] << 8) | buf[11]
+    if end < 16 + data_size:
+        return None, 0
+    return bytes(buf[16:16 + data_size]), 16 + data_size
@@ -3,22 +3,123 @@ import re
 import struct
 import time
 import socket, select
+import selectors
 import threading
 import xmltodict
-import json
+try:
+    # libxml2-backed parser; much faster for the KB-scale NRI payloads
+    from lxml import etree
+except ImportError:
+    etree = None
+from functools import lru_cache
 try:
     import queue as queue
 except ImportError:
     import Queue as queue
 import netifaces
-from collections import namedtuple
+from collections import namedtuple, deque
 
 from . import commands
-from .utils import ValueRange, format_nri_list
+from .utils import ValueRange, format_nri_list, to_plain_dict
+try:
+    # Optional Cython accelerator for packet framing
+    from . import _framing
+except ImportError:
+    _framing = None
 
 BUFFER_SIZE = 64 * 1024
 _LOGGER = logging.getLogger(__name__)
 
+# Compile the regular expressions used on the command hot paths once at
+# import time, rather than relying on the (small) cache in the ``re``
+# module for every message we process.
+_HEX_RE = re.compile(r'[+-]?[0-9a-f]+$', re.IGNORECASE)
+_INFO_RE = re.compile(r'''
+    !
+    (?P<device_category>\d)
+    ECN
+    (?P<model_name>[^/]*)/
+    (?P<iscp_port>\d{5})/
+    (?P<area_code>\w{2})/
+    (?P<identifier>.{0,12})
+''', re.VERBOSE)
+
+# Translation tables for splitting commands and arguments. Folding the
+# alternate separators into spaces and using ``str.split`` is much
+# cheaper than a regex split for these tiny separator sets.
+_SEP_TRANS = str.maketrans('.', ' ')
+_ARG_TRANS = str.maketrans(',', ' ')
+
+
+def _build_iscp_index():
+    """Build a flat ``prefix -> (kind, zone, name, values)`` index over
+    ``commands.COMMANDS``, so that decoding an incoming message is a
+    single dict lookup rather than a scan over all zones. Where a
+    prefix occurs in more than one zone, the first zone wins, matching
+    the iteration order of the old per-zone scan.
+
+    Each command is also classified by the shape of its value space,
+    so the decode path does only the work that command needs:
+
+    ``'enum'``
+        Only named values; decode with one dict probe, no hex check.
+    ``'hex'``
+        Only numeric ranges; skip the values dict entirely.
+    ``'mixed'``
+        Named values plus ranges; dict probe, then hex fallback.
+    """
+    index = {}
+    for zone, zone_cmds in commands.COMMANDS.items():
+        for prefix, meta in zone_cmds.items():
+            if prefix in index:
+                continue
+            # Range keys are tuples like (0, 200); an incoming args
+            # string can never equal one, so keep only the named
+            # values and remember that ranges were present.
+            values = {key: value for key, value in meta['values'].items()
+                      if isinstance(key, str)}
+            if not values:
+                kind = 'hex'
+            elif len(values) != len(meta['values']):
+                kind = 'mixed'
+            else:
+                kind = 'enum'
+            index[prefix] = (kind, zone, meta['name'], values)
+    return index
+
+_ISCP_INDEX = _build_iscp_index()
+
+
+def _build_arg_index():
+    """Split every ``commands.VALUE_MAPPINGS`` entry into a plain
+    alias dict and the list of :class:`ValueRange` objects it
+    contains. This lets :func:`command_to_iscp` resolve an argument
+    with one dict probe plus a scan over only the ranges (usually just
+    one), instead of walking every alias looking for a range.
+    """
+    index = {}
+    for group, prefixes in commands.VALUE_MAPPINGS.items():
+        for prefix, mapping in prefixes.items():
+            aliases = {}
+            ranges = []
+            for key, value in mapping.items():
+                if isinstance(key, ValueRange):
+                    ranges.append(key)
+                else:
+                    aliases[key] = value
+            index[(group, prefix)] = (aliases, ranges)
+    return index
+
+_ARG_INDEX = _build_arg_index()
+
+# The eISCP header layout: magic, header size, data size, version,
+# reserved. Only the data size varies per packet, so keep the constant
+# parts around the 4-byte length pre-packed, and a compiled Struct for
+# parsing incoming headers.
+_HEADER_STRUCT = struct.Struct('! 4s I I b 3s')
+_HEADER_PREFIX = b'ISCP\x00\x00\x00\x10'   # magic + header_size=16
+_HEADER_SUFFIX = b'\x01\x00\x00\x00'       # version + reserved
+
 
 class ISCPMessage(object):
     """Deals with formatting and parsing data wrapped in an ISCP
@@ -41,6 +142,12 @@ class ISCPMessage(object):
         # End character may be CR, LF or CR+LF, according to doc
         return '!1{}\r'.format(self.data)
 
+    def as_bytes(self):
+        """The message in its on-the-wire form. ISCP is plain ASCII,
+        so this skips the str round-trip of ``str(message).encode()``.
+        """
+        return b'!1' + self.data.encode('ascii') + b'\r'
+
     @classmethod
     def parse(self, data):
         EOF = '\x1a'
@@ -65,19 +172,17 @@ class eISCPPacket(object):
         'magic, header_size, data_size, version, reserved'))
 
     def __init__(self, iscp_message):
-        iscp_message = str(iscp_message)
         # We attach data separately, because Python's struct module does
-        # not support variable length strings,
-        header = struct.pack(
-            '! 4s I I b 3s',
-            b'ISCP',            # magic
-            16,                 # header size (16 bytes)
-            len(iscp_message),  # data size
-            0x01,               # version
-            b'\x00\x00\x00'     #reserved
-        )
-
-        self._bytes = header + iscp_message.encode('utf-8')
+        # not support variable length strings. Only the data size field
+        # of the header varies, so assemble it around the pre-packed
+        # constant parts.
+        if isinstance(iscp_message, bytes):
+            body = iscp_message
+        else:
+            body = str(iscp_message).encode('utf-8')
+        self._bytes = (
+            _HEADER_PREFIX + len(body).to_bytes(4, 'big') +
+            _HEADER_SUFFIX + body)
         # __new__, string subclass?
 
     def __str__(self):
@@ -91,7 +196,8 @@ class eISCPPacket(object):
         """Parse the eISCP package given by ``bytes``.
         """
         h = cls.parse_header(bytes[:16])
-        data = bytes[h.header_size:h.header_size + h.data_size].decode()
+        # ISCP payloads are plain ASCII by definition
+        data = bytes[h.header_size:h.header_size + h.data_size].decode('ascii')
         assert len(data) == h.data_size
         return data
 
@@ -103,29 +209,35 @@ class eISCPPacket(object):
         because you can subsequently know the number of bytes to
         expect in the packet.
         """
-        # A header is always 16 bytes in length
-        assert len(bytes) == 16
-
-        # Parse the header
+        # Parse the header; the magic and reserved fields are kept as
+        # bytes, nothing downstream needs their string form.
         magic, header_size, data_size, version, reserved = \
-            struct.unpack('! 4s I I b 3s', bytes)
-
-        magic = magic.decode()
-        reserved = reserved.decode()
+            _HEADER_STRUCT.unpack_from(bytes, 0)
 
         # Strangly, the header contains a header_size field.
-        assert magic == 'ISCP'
-        assert header_size == 16
+        if magic != b'ISCP' or header_size != 16:
+            raise ValueError('bad eISCP header')
 
         return eISCPPacket.header(
             magic, header_size, data_size, version, reserved)
 
 
+@lru_cache(maxsize=256)
 def command_to_packet(command):
     """Convert an ascii command like (PVR00) to the binary data we
     need to send to the receiver.
+
+    The set of low-level commands a client sends in a session is tiny
+    (power, muting, volume steps, queries), so the resulting packets
+    are cached and repeat sends cost a single dict probe.
     """
-    return eISCPPacket(ISCPMessage(command)).get_raw()
+    return eISCPPacket(ISCPMessage(command).as_bytes()).get_raw()
+
+
+# The discovery magic packets never change; build them once at import
+# time instead of on every discover()/info lookup.
+_ONKYO_MAGIC_PACKET = eISCPPacket('!xECNQSTN').get_raw()
+_PIONEER_MAGIC_PACKET = eISCPPacket('!pECNQSTN').get_raw()
 
 
 def normalize_command(command):
@@ -167,25 +279,24 @@ def command_to_iscp(command, arguments=None, zone=None):
         command('zone2.volume=66')
     """
     default_zone = 'main'
-    command_sep = r'[. ]'
     norm = lambda s: s.strip().lower()
 
     # If parts are not explicitly given, parse the command
     if arguments is None and zone is None:
         # Separating command and args with colon allows multiple args
-        if ':' in command or '=' in command:
-            base, arguments = re.split(r'[:=]', command, 1)
-            parts = [norm(c) for c in re.split(command_sep, base)]
+        base, sep, arguments = command.replace('=', ':').partition(':')
+        if sep:
+            parts = [norm(c) for c in base.translate(_SEP_TRANS).split()]
             if len(parts) == 2:
                 zone, command = parts
             else:
                 zone = default_zone
                 command = parts[0]
             # Split arguments by comma or space
-            arguments = [norm(a) for a in re.split(r'[ ,]', arguments)]
+            arguments = [norm(a) for a in arguments.translate(_ARG_TRANS).split()]
         else:
             # Split command part by space or dot
-            parts = [norm(c) for c in re.split(command_sep, command)]
+            parts = [norm(c) for c in command.translate(_SEP_TRANS).split()]
             if len(parts) >= 3:
                 zone, command = parts[:2]
                 arguments = parts[2:]
@@ -197,12 +308,14 @@ def command_to_iscp(command, arguments=None, zone=None):
                 raise ValueError('Need at least command and argument')
 
     # Find the command in our database, resolve to internal eISCP command
-    group = commands.ZONE_MAPPINGS.get(zone, zone)
-    if not zone in commands.COMMANDS:
+    zone_mappings = commands.ZONE_MAPPINGS
+    all_commands = commands.COMMANDS
+    group = zone_mappings.get(zone, zone)
+    if not zone in all_commands:
         raise ValueError('"{}" is not a valid zone'.format(zone))
 
     prefix = commands.COMMAND_MAPPINGS[group].get(command, command)
-    if not prefix in commands.COMMANDS[group]:
+    if not prefix in all_commands[group]:
         raise ValueError('"{}" is not a valid command in zone "{}"'.format(
                 command, zone))
 
@@ -216,57 +329,57 @@ def command_to_iscp(command, arguments=None, zone=None):
     else:
         argument = arguments
 
-        # 1. Consider if there is a alias, e.g. level-up for UP.
+    # 1. Consider if there is a alias, e.g. level-up for UP.
+    aliases, ranges = _ARG_INDEX[(group, prefix)]
     try:
-        value = commands.VALUE_MAPPINGS[group][prefix][argument]
+        value = aliases[argument]
     except KeyError:
         # 2. See if we can match a range or pattern
-        for possible_arg in commands.VALUE_MAPPINGS[group][prefix]:
-            if type(argument) is int or (type(argument) is str and argument.lstrip("-").isdigit() is True):
-                if isinstance(possible_arg, ValueRange):
-                    if int(argument) in possible_arg:
-                        # We need to send the format "FF", hex() gives us 0xff
-                        value = hex(int(argument))[2:].zfill(2).upper()
-                        if prefix == 'SWL' or prefix == 'CTL':
-                            if value == '00':
-                                value = '0' + value
-                            elif value[0] != 'X':
-                                value = '+' + value
-                            elif value[0] == 'X':
-                                if len(value) == 2:
-                                    value = '-' + '0' + value[1:]
-                                value = '-' + value[1:]
-                        break
+        if type(argument) is int or (type(argument) is str and argument.lstrip("-").isdigit() is True):
+            iv = int(argument)
+            for possible_arg in ranges:
+                if iv in possible_arg:
+                    # We need to send the format "FF", zero-padded
+                    # uppercase hex
+                    value = f'{iv:02X}'
+                    if prefix == 'SWL' or prefix == 'CTL':
+                        # Subwoofer/center level want an explicit sign
+                        # ("+05", "-05"), except at 0 ("000")
+                        if iv == 0:
+                            value = '000'
+                        elif iv > 0:
+                            value = f'+{iv:02X}'
+                        else:
+                            value = f'-{-iv:02X}'
+                    break
 
-            # TODO: patterns not yet supported
-            else:
-                raise ValueError('"{}" is not a valid argument for command '
-                                '"{}" in zone "{}"'.format(argument, command, zone))
+        # TODO: patterns not yet supported
+        else:
+            raise ValueError('"{}" is not a valid argument for command '
+                            '"{}" in zone "{}"'.format(argument, command, zone))
 
     return '{}{}'.format(prefix, value)
 
 
 def iscp_to_command(iscp_message, with_zone=False):
-    def __iscp_to_command(iscp_message):
-        for zone, zone_cmds in commands.COMMANDS.items():
-            # For now, ISCP commands are always three characters, which
-            # makes this easy.
-            command, args = iscp_message[:3], iscp_message[3:]
-            if command in zone_cmds:
-                if args in zone_cmds[command]['values']:
-                    return zone, zone_cmds[command]['name'], \
-                           zone_cmds[command]['values'][args]['name']
-                else:
-                    match = re.match('[+-]?[0-9a-f]+$', args, re.IGNORECASE)
-                    if match:
-                        return zone, zone_cmds[command]['name'], int(args, 16)
-                    else:
-                        return zone, zone_cmds[command]['name'], args
-        else:
-            raise ValueError(
-                'Cannot convert ISCP message to command: {}'.format(iscp_message))
-    zone, ret_cmd, args = __iscp_to_command(iscp_message)
-    return (zone, ret_cmd, args) if with_zone else (ret_cmd, args)
+    # For now, ISCP commands are always three characters, which
+    # makes this easy.
+    entry = _ISCP_INDEX.get(iscp_message[:3])
+    if entry is None:
+        raise ValueError(
+            'Cannot convert ISCP message to command: {}'.format(iscp_message))
+    kind, zone, name, values = entry
+    args = iscp_message[3:]
+    if kind == 'hex':
+        if _HEX_RE.match(args):
+            args = int(args, 16)
+    else:
+        value = values.get(args)
+        if value is not None:
+            args = value['name']
+        elif kind == 'mixed' and _HEX_RE.match(args):
+            args = int(args, 16)
+    return (zone, name, args) if with_zone else (name, args)
 
 def filter_for_message(getter_func, msg):
     """Helper that calls ``getter_func`` until a matching message
@@ -300,45 +413,111 @@ def parse_info(data):
     response = eISCPPacket.parse(data)
     # Return string looks something like this:
     # !1ECNTX-NR609/60128/DX
-    info = re.match(r'''
-        !
-        (?P<device_category>\d)
-        ECN
-        (?P<model_name>[^/]*)/
-        (?P<iscp_port>\d{5})/
-        (?P<area_code>\w{2})/
-        (?P<identifier>.{0,12})
-    ''', response.strip(), re.VERBOSE).groupdict()
+    info = _INFO_RE.match(response.strip()).groupdict()
     return info
 
+def _element_to_dict(el):
+    """Convert an XML element tree to the same dict structure that
+    ``xmltodict.parse(..., attr_prefix="")`` produces: attributes and
+    child tags become keys, repeated child tags become lists, and a
+    text-only element collapses to its text.
+    """
+    children = list(el)
+    text = el.text.strip() if el.text and el.text.strip() else None
+    if not children and not el.attrib:
+        return text
+    result = dict(el.attrib)
+    for child in children:
+        value = _element_to_dict(child)
+        tag = child.tag
+        if tag in result:
+            if isinstance(result[tag], list):
+                result[tag].append(value)
+            else:
+                result[tag] = [result[tag], value]
+        else:
+            result[tag] = value
+    if text is not None:
+        result['#text'] = text
+    return result
+
+
+def parse_xml(data):
+    """Parse an XML document (NRI, MDI) into a plain dict, using lxml
+    when it is available and falling back to xmltodict otherwise.
+    """
+    if etree is not None:
+        root = etree.fromstring(data.encode('utf-8'))
+        return {root.tag: _element_to_dict(root)}
+    return to_plain_dict(xmltodict.parse(data, attr_prefix=""))
+
+
 class MessageBuffer:
     """A receive buffer for eISCP packets to avoid partial receipt"""
 
     def __init__(self, buffer_size):
         self.buffer_size = buffer_size
-        self.buffer = b''
+        # Preallocate the full buffer once; ``end`` tracks how much of
+        # it is filled. Socket reads go directly into the free tail
+        # via recv_into, so no intermediate bytes objects are created.
+        self.buffer = bytearray(buffer_size)
+        self.end = 0
 
     def reset(self):
         """Reset the buffer"""
-        self.buffer = b''
+        self.end = 0
 
     @property
     def available(self):
         """Bytes remaining in the buffer"""
-        return self.buffer_size - len(self.buffer)
+        return self.buffer_size - self.end
 
     def recv(self, data: bytes):
         """Add received bytes to the buffer"""
-        self.buffer += data
+        n = len(data)
+        self.buffer[self.end:self.end + n] = data
+        self.end += n
+
+    def recv_into(self, sock):
+        """Read from ``sock`` directly into the free part of the
+        buffer, avoiding the intermediate allocation and copy of
+        ``sock.recv()`` + :meth:`recv`. Returns the number of bytes
+        read (0 on an orderly remote shutdown).
+        """
+        n = sock.recv_into(memoryview(self.buffer)[self.end:])
+        self.end += n
+        return n
 
     def get_message(self):
         """Return a message if one is available in the buffer, otherwise return None"""
-        if len(self.buffer) >= 16:
-            header = eISCPPacket.parse_header(self.buffer[:16])
-            if len(self.buffer) >= header.data_size + 16:
-                packet = ISCPMessage.parse(self.buffer[16:header.data_size + 16].decode())
-                # Remove the processed message from the remaining buffer
-                self.buffer = self.buffer[16 + header.data_size:]
+        if _framing is not None:
+            payload, consumed = _framing.parse_packet(self.buffer, self.end)
+            if payload is None:
+                return None
+            packet = ISCPMessage.parse(payload.decode('ascii'))
+            remaining = self.end - consumed
+            self.buffer[:remaining] = self.buffer[consumed:self.end]
+            self.end = remaining
+            return packet
+        if self.end >= 16:
+            # Unpack the header in place; slicing out 16 bytes per
+            # packet just to parse them again is wasted copying.
+            magic, header_size, data_size, version, reserved = \
+                _HEADER_STRUCT.unpack_from(self.buffer, 0)
+            # Fail loudly on a desynced or garbage stream rather than
+            # waiting forever on a bogus data size. Same check as the
+            # Cython framing path.
+            if magic != b'ISCP' or header_size != 16:
+                raise ValueError('bad eISCP header')
+            if self.end >= data_size + 16:
+                # ISCP payloads are plain ASCII by definition
+                packet = ISCPMessage.parse(
+                    self.buffer[16:data_size + 16].decode('ascii'))
+                # Shift any remaining bytes to the front of the buffer
+                consumed = 16 + data_size
+                remaining = self.end - consumed
+                self.buffer[:remaining] = self.buffer[consumed:self.end]
+                self.end = remaining
                 return packet
         return None
 
@@ -363,15 +542,17 @@ class eISCP(object):
         Waits for ``timeout`` seconds, then returns all devices found,
         in form of a list of dicts.
         """
-        onkyo_magic = eISCPPacket('!xECNQSTN').get_raw()
-        pioneer_magic = eISCPPacket('!pECNQSTN').get_raw()
         # Since due to interface aliasing we may see the same Onkyo device
         # multiple times, we build the list as a dict keyed by the
         # unique identifier code
         found_receivers = {}
 
         # We do this on all network interfaces
-        # which have an AF_INET address and broadcast address
+        # which have an AF_INET address and broadcast address.
+        # Broadcast the magic on every interface first, then wait for
+        # replies on all sockets together, so discovery takes at most
+        # ``timeout`` seconds regardless of the number of interfaces.
+        socks = []
         for interface in netifaces.interfaces():
             ifaddrs=netifaces.ifaddresses(interface)
             if not netifaces.AF_INET in ifaddrs:
@@ -385,24 +566,31 @@ class eISCP(object):
                 sock.setblocking(0)   # So we can use select()
                 sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
                 sock.bind((ifaddr["addr"], 0))
-                sock.sendto(onkyo_magic, (ifaddr["broadcast"], eISCP.ONKYO_PORT))
-                sock.sendto(pioneer_magic, (ifaddr["broadcast"], eISCP.ONKYO_PORT))
-        
-                while True:
-                    ready = select.select([sock], [], [], timeout)
-                    if not ready[0]:
-                        break
-                    data, addr = sock.recvfrom(1024)
-
-                    info = parse_info(data)
-        
-                    # Give the user a ready-made receiver instance. It will only
-                    # connect on demand, when actually used.
-                    receiver = (clazz or eISCP)(addr[0], int(info['iscp_port']))
-                    receiver.info = info
-                    found_receivers[info["identifier"]]=receiver
-        
-                sock.close()
+                sock.sendto(_ONKYO_MAGIC_PACKET, (ifaddr["broadcast"], eISCP.ONKYO_PORT))
+                sock.sendto(_PIONEER_MAGIC_PACKET, (ifaddr["broadcast"], eISCP.ONKYO_PORT))
+                socks.append(sock)
+
+        deadline = time.time() + timeout
+        while socks:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                break
+            ready = select.select(socks, [], [], remaining)[0]
+            if not ready:
+                break
+            for sock in ready:
+                data, addr = sock.recvfrom(1024)
+
+                info = parse_info(data)
+
+                # Give the user a ready-made receiver instance. It will only
+                # connect on demand, when actually used.
+                receiver = (clazz or eISCP)(addr[0], int(info['iscp_port']))
+                receiver.info = info
+                found_receivers[info["identifier"]]=receiver
+
+        for sock in socks:
+            sock.close()
         return list(found_receivers.values())
 
     def __init__(self, host, port=60128):
@@ -410,6 +598,9 @@ class eISCP(object):
         self.port = port
         self._info = None
         self._nri = None
+        # Caches the formatted views derived from the NRI data
+        # (net_services, zones, ...); NRI does not change mid-session.
+        self._nri_views = {}
         self._message_buffer = MessageBuffer(BUFFER_SIZE)
 
         self.command_socket = None
@@ -444,7 +635,7 @@ class eISCP(object):
                 socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
             sock.setblocking(0)
             sock.bind(('0.0.0.0', 0))
-            sock.sendto(eISCPPacket('!xECNQSTN').get_raw(), (self.host, self.port))
+            sock.sendto(_ONKYO_MAGIC_PACKET, (self.host, self.port))
 
             ready = select.select([sock], [], [], 0.1)
             if ready[0]:
@@ -465,52 +656,66 @@ class eISCP(object):
 
     @property
     def net_services(self):
-        data = self.nri.get('netservicelist').get('netservice')
-        return format_nri_list(data)
+        if 'net_services' not in self._nri_views:
+            data = self.nri.get('netservicelist').get('netservice')
+            self._nri_views['net_services'] = format_nri_list(data)
+        return self._nri_views['net_services']
 
     @property
     def zones(self):
-        data = self.nri.get('zonelist').get('zone')
-        return format_nri_list(data)
+        if 'zones' not in self._nri_views:
+            data = self.nri.get('zonelist').get('zone')
+            self._nri_views['zones'] = format_nri_list(data)
+        return self._nri_views['zones']
 
     @property
     def controls(self):
-        data = self.nri.get('controllist').get('control')
-        return format_nri_list(data)
+        if 'controls' not in self._nri_views:
+            data = self.nri.get('controllist').get('control')
+            self._nri_views['controls'] = format_nri_list(data)
+        return self._nri_views['controls']
 
     @property
     def functions(self):
-        data = self.nri.get('functionlist').get('function')
-        return format_nri_list(data)
+        if 'functions' not in self._nri_views:
+            data = self.nri.get('functionlist').get('function')
+            self._nri_views['functions'] = format_nri_list(data)
+        return self._nri_views['functions']
 
     @property
     def selectors(self):
-        data = self.nri.get('selectorlist').get('selector')
-        info = format_nri_list(data)
-        # Remove Source selector
-        if info.get("Source") is not None:
-            info.pop("Source")
-        return info
+        if 'selectors' not in self._nri_views:
+            data = self.nri.get('selectorlist').get('selector')
+            info = format_nri_list(data)
+            # Remove Source selector
+            if info.get("Source") is not None:
+                info.pop("Source")
+            self._nri_views['selectors'] = info
+        return self._nri_views['selectors']
 
     @property
     def presets(self):
-        info = {}
-        data = self.nri.get('presetlist').get('preset')
-        for item in data:
-            if item.get("id") is not None:
-                key = item.pop("id")
-                info[key] = item
-        return info
+        if 'presets' not in self._nri_views:
+            info = {}
+            data = self.nri.get('presetlist').get('preset')
+            for item in data:
+                if item.get("id") is not None:
+                    key = item.pop("id")
+                    info[key] = item
+            self._nri_views['presets'] = info
+        return self._nri_views['presets']
 
     @property
     def tuners(self):
-        info = {}
-        data = self.nri.get('tuners').get('tuner')
-        for item in data:
-            if item.get("band") is not None:
-                key = item.pop("band")
-                info[key] = item
-        return info
+        if 'tuners' not in self._nri_views:
+            info = {}
+            data = self.nri.get('tuners').get('tuner')
+            for item in data:
+                if item.get("band") is not None:
+                    key = item.pop("band")
+                    info[key] = item
+            self._nri_views['tuners'] = info
+        return self._nri_views['tuners']
 
     def _ensure_socket_connected(self):
         if self.command_socket is None:
@@ -566,20 +771,45 @@ class eISCP(object):
         ready = select.select([self.command_socket], [], [], timeout or 0)
         if ready[0]:
             try:
-                data = self.command_socket.recv(self._message_buffer.available)
-                self._message_buffer.recv(data)
-                if len(data) == 0:
+                received = self._message_buffer.recv_into(self.command_socket)
+                if received == 0:
                     _LOGGER.error(f"Received no data on socket. Disconnecting")
                     # We have very likely been disconnected
                     eISCP.disconnect(self)
                     return None
-                _LOGGER.info(f"Received {len(data)} bytes")
+                _LOGGER.info(f"Received {received} bytes")
                 return self._message_buffer.get_message()
             except OSError as error:
                 _LOGGER.error("Disconnected from receiver", error)
                 eISCP.disconnect(self)
         return None
 
+    def _drain_nonblocking(self):
+        """Discard any messages pending on the socket. The command
+        socket is non-blocking, so we simply read until the kernel has
+        nothing left for us, without a select() round per read.
+        """
+        self._ensure_socket_connected()
+        # Complete messages may be sitting in the buffer from an
+        # earlier read; clear those as well, not just the socket.
+        while self._message_buffer.get_message():
+            pass
+        while True:
+            try:
+                received = self._message_buffer.recv_into(self.command_socket)
+            except BlockingIOError:
+                break
+            except OSError as error:
+                _LOGGER.error("Disconnected from receiver", error)
+                eISCP.disconnect(self)
+                break
+            if received == 0:
+                # We have very likely been disconnected
+                eISCP.disconnect(self)
+                break
+            while self._message_buffer.get_message():
+                pass
+
     def raw(self, iscp_message):
         """Send a low-level ISCP message, like ``MVL50``, and wait
         for a response.
@@ -595,11 +825,10 @@ class eISCP(object):
         processing all incoming messages the same way, regardless of
         their origin.
         """
-        while self.get(False):
-            # Clear all incoming messages. If not yet queried,
-            # they are lost. This is so that we can find the real
-            # response to our sent command later.
-            pass
+        # Clear all incoming messages. If not yet queried,
+        # they are lost. This is so that we can find the real
+        # response to our sent command later.
+        self._drain_nonblocking()
         self.send(iscp_message)
         return filter_for_message(self.get, iscp_message)
 
@@ -629,14 +858,13 @@ class eISCP(object):
         Calling this method twice with the same arguments does not generate a response from the receiver, thus causing a timeout on the message."""
         if otherIDs:
             # check if the supplied deviceIDs are all strings
-            for ID in otherIDs:
-                if type(ID) != str:
-                    raise ValueError('group_with needs a list object, with each device identifier as a string')
+            if not all(isinstance(ID, str) for ID in otherIDs):
+                raise ValueError('group_with needs a list object, with each device identifier as a string')
             # construct a MGS message with a list of the device IDs
-            message='MGS<mgs zone="1"><groupid>1</groupid><maxdelay>500</maxdelay><devices>' + \
-                '<device id="%s" zoneid="1"/>'%(self.identifier) + \
-                ''.join(['<device id="%s" zoneid="1"/>'%(ID) for ID in otherIDs]) + \
-                '</devices></mgs>'
+            devices = ''.join(f'<device id="{ID}" zoneid="1"/>'
+                              for ID in (self.identifier, *otherIDs))
+            message = ('MGS<mgs zone="1"><groupid>1</groupid>'
+                       f'<maxdelay>500</maxdelay><devices>{devices}</devices></mgs>')
         else:
             # No other devices specified. Create an empty group, which stops the multiroom audio / flareconnect
             message='MGS<mgs zone="1"><groupid>0</groupid></mgs>'
@@ -699,9 +927,7 @@ class eISCP(object):
             # strip the "MDI" from the start of the reply
             data = data.replace('MDI','')
             # turn it into a dict
-            data = xmltodict.parse(data, attr_prefix="")
-            # Cast OrderedDict to dict
-            data = json.loads(json.dumps(data))
+            data = parse_xml(data)
             # the interesting part here is the ["mdi"]["zonelist"]["zone"] part
             zonelist = data["mdi"]["zonelist"]["zone"]
             for zone in zonelist:
@@ -713,10 +939,8 @@ class eISCP(object):
         """Return NRI info as dict."""
         data = self.command("dock.receiver-information=query")[1]
         if data:
-            data = xmltodict.parse(data, attr_prefix="")
+            data = parse_xml(data)
             data = data.get("response").get("device")
-            # Cast OrderedDict to dict
-            data = json.loads(json.dumps(data))
             self._nri = data
         return data
 
@@ -744,20 +968,35 @@ class Receiver(eISCP):
         if not getattr(self, '_thread', False):
             self._stop = False
             self._queue = queue.Queue()
+            # Maps the expected 3-char response prefix to a FIFO of
+            # ``(event, result)`` pairs, one per :meth:`raw` call
+            # waiting for such a response. A queue rather than a
+            # single slot, so concurrent raw() calls for the same
+            # command do not clobber each other.
+            self._pending = {}
+            # A socketpair lets send()/raw() wake the background
+            # thread the moment something is queued, so the thread can
+            # sleep indefinitely instead of polling the queue.
+            self._wakeup_r, self._wakeup_w = socket.socketpair()
+            self._wakeup_r.setblocking(0)
             self._thread = threading.Thread(target=self._thread_loop)
             self._thread.start()
 
     def disconnect(self):
         self._stop = True
+        self._wakeup_w.send(b'\x00')
         self._thread.join()
         self._thread = None
+        self._wakeup_r.close()
+        self._wakeup_w.close()
 
     def send(self, iscp_message):
         """Like :meth:`eISCP.send`, but sends asynchronously via the
         background thread.
         """
         self._ensure_thread_running()
-        self._queue.put((iscp_message, None, None))
+        self._queue.put(iscp_message)
+        self._wakeup_w.send(b'\x00')
 
     def get(self, *a, **kw):
         """Not supported by this class. Use the :attr:`on_message``
@@ -769,10 +1008,31 @@ class Receiver(eISCP):
         """Like :meth:`eISCP.raw`.
         """
         self._ensure_thread_running()
+        prefix = iscp_message[:3]
+        # HDMI-CEC commands (CTV) never send a response/confirmation,
+        # so there is nothing to wait for.
+        if prefix == 'CTV':
+            self._queue.put(iscp_message)
+            self._wakeup_w.send(b'\x00')
+            return iscp_message
         event = threading.Event()
         result = []
-        self._queue.put((iscp_message, event, result))
-        event.wait()
+        # The MGS command for grouping multiroom audio returns an MDI
+        # message, not MGS. Register before queueing, so the response
+        # cannot slip past between send and registration.
+        key = 'MDI' if prefix == 'MGS' else prefix
+        waiter = (event, result)
+        self._pending.setdefault(key, deque()).append(waiter)
+        self._queue.put(iscp_message)
+        self._wakeup_w.send(b'\x00')
+        if not event.wait(5.0):
+            waiters = self._pending.get(key)
+            if waiters is not None:
+                try:
+                    waiters.remove(waiter)
+                except ValueError:
+                    pass
+            raise ValueError('Timeout waiting for response.')
         if isinstance(result[0], Exception):
             raise result[0]
         return result[0]
@@ -783,41 +1043,64 @@ class Receiver(eISCP):
                 self.on_message(message)
 
         eISCP._ensure_socket_connected(self)
+        # Register the file descriptors rather than the socket objects;
+        # the command socket may be closed and replaced on reconnect,
+        # at which point its fileno() is no longer valid for lookup.
+        sel = selectors.DefaultSelector()
+        wakeup_fd = self._wakeup_r.fileno()
+        sel.register(wakeup_fd, selectors.EVENT_READ)
+        sock = self.command_socket
+        sock_fd = sock.fileno()
+        sel.register(sock_fd, selectors.EVENT_READ)
         try:
             while not self._stop:
+                # Sleep until the receiver sends us something, or a
+                # send()/raw() call wakes us via the socketpair.
+                for key, _ in sel.select():
+                    if key.fd == wakeup_fd:
+                        try:
+                            while self._wakeup_r.recv(1024):
+                                pass
+                        except BlockingIOError:
+                            pass
+
                 # Clear all incoming message first.
                 while True:
                     msg = eISCP.get(self, False)
                     if not msg:
                         break
-                    trigger(msg)
-
-                # Send next message
-                try:
-                    item = self._queue.get(timeout=0.01)
-                except queue.Empty:
-                    continue
-                if item:
-                    message, event, result = item
-                    eISCP.send(self, message)
-
-                    # Wait for a response, if the caller so desires
-                    if event:
-                        try:
-                            # XXX We are losing messages here, since
-                            # those are not triggering the callback!
-                            # eISCP.raw() really has the same problem,
-                            # messages being dropped without a chance
-                            # to get() them. Maybe use a queue after all.
-                            response = filter_for_message(
-                                super(Receiver, self).get, message)
-                        except ValueError as e:
-                            # No response received within timeout
-                            result.append(e)
-                        else:
-                            result.append(response)
-                        # Mark as processed
+                    # If a raw() call is blocked waiting for this
+                    # response, hand the message over to the oldest
+                    # waiter; otherwise it is an unsolicited status
+                    # update for the callback.
+                    waiters = self._pending.get(msg[:3])
+                    if waiters:
+                        event, result = waiters.popleft()
+                        result.append(msg)
                         event.set()
+                    else:
+                        trigger(msg)
+
+                # Send any queued messages
+                while True:
+                    try:
+                        message = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if message:
+                        eISCP.send(self, message)
+
+                # get()/send() transparently reconnect after a
+                # disconnect; pick up the new socket if they did.
+                if self.command_socket is not sock:
+                    sel.unregister(sock_fd)
+                    sock = self.command_socket
+                    if sock is None:
+                        eISCP._ensure_socket_connected(self)
+                        sock = self.command_socket
+                    sock_fd = sock.fileno()
+                    sel.register(sock_fd, selectors.EVENT_READ)
 
         finally:
+            sel.close()
             eISCP.disconnect(self)
@@ -16,6 +16,18 @@ class ValueRange(object):
         return value in self._range
 
 
+def to_plain_dict(data):
+    """Recursively convert the OrderedDicts produced by xmltodict into
+    plain dicts. One traversal, instead of the JSON encode/decode
+    round-trip previously used for this.
+    """
+    if isinstance(data, dict):
+        return {key: to_plain_dict(value) for key, value in data.items()}
+    if isinstance(data, list):
+        return [to_plain_dict(item) for item in data]
+    return data
+
+
 def format_nri_list(data):
     """Return NRI lists as dict with names or ids as the key."""
     if not data:
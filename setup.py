@@ -1,11 +1,23 @@
 #!/usr/bin/env python
 # coding: utf8
 
+import os
 from setuptools import setup, find_packages
 
-# Get long_description from README
-import os
 here = os.path.dirname(os.path.abspath(__file__))
+
+# The Cython framing accelerator is optional; the package is fully
+# functional as pure Python when Cython is not available at build
+# time, or when the .pyx source is missing from the distribution.
+ext_modules = []
+if os.path.exists(os.path.join(here, 'eiscp', '_framing.pyx')):
+    try:
+        from Cython.Build import cythonize
+        ext_modules = cythonize(['eiscp/_framing.pyx'])
+    except ImportError:
+        pass
+
+# Get long_description from README
 f = open(os.path.join(here, 'README.rst'))
 long_description = f.read().strip()
 f.close()
@@ -22,6 +34,8 @@ setup(
     packages = find_packages(exclude=('tests*',)),
     entry_points="""[console_scripts]\nonkyo = eiscp.script:run\n""",
     install_requires=['docopt>=0.4.1', 'netifaces', 'xmltodict>=0.12.0'],
+    extras_require={'fast': ['lxml']},
+    ext_modules=ext_modules,
     platforms='any',
     classifiers=[
         'Topic :: System :: Networking',
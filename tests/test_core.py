@@ -11,6 +11,25 @@ class TestIscpToCommand(TestCase):
         self.assertEqual(('zone3', 'muting', ''), iscp_to_command('MT3', True))
         self.assertEqual(('zone4', 'muting', ''), iscp_to_command('MT4', True))
 
+    def test_named_value(self):
+        self.assertEqual(('system-power', 'on'), iscp_to_command('PWR01'))
+
+    def test_enum_unknown_argument(self):
+        # An enum-only command returns an unlisted argument as-is
+        self.assertEqual(('system-power', '02'), iscp_to_command('PWR02'))
+
+    def test_hex_only_command(self):
+        # A range-only command decodes its argument as hex
+        self.assertEqual(('preset-memory', 5), iscp_to_command('PRM05'))
+
+    def test_mixed_hex_fallback(self):
+        # Commands with both named values and ranges fall back to hex
+        self.assertEqual(('master-volume', 0x22), iscp_to_command('MVL22'))
+        self.assertEqual(('master-volume', 'level-up'), iscp_to_command('MVLUP'))
+
+    def test_unknown_command(self):
+        self.assertRaises(ValueError, iscp_to_command, 'XYZ01')
+
 class TestCommandToIscp(TestCase):
     def test(self):
         self.assertEqual('PWR00', command_to_iscp('main.system-power=standby'))
@@ -22,3 +41,13 @@ class TestCommandToIscp(TestCase):
         self.assertEqual('NTCTRUP', command_to_iscp('network-usb', 'trup', 'dock'))
         self.assertEqual('NTCTRUP', command_to_iscp('dock.network-usb=trup'))
         self.assertEqual('NTCTRUP', command_to_iscp('dock.network-usb trup'))
+
+    def test_range_argument(self):
+        self.assertEqual('MVL22', command_to_iscp('main.volume=34'))
+
+    def test_signed_level_arguments(self):
+        # Subwoofer/center levels carry an explicit sign, except at 0
+        self.assertEqual('SWL+05', command_to_iscp('main.subwoofer-temporary-level=5'))
+        self.assertEqual('SWL-05', command_to_iscp('main.subwoofer-temporary-level=-5'))
+        self.assertEqual('SWL000', command_to_iscp('main.subwoofer-temporary-level=0'))
+        self.assertEqual('CTL-0C', command_to_iscp('main.center-temporary-level=-12'))